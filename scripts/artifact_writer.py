@@ -0,0 +1,142 @@
+import gzip
+import json
+from pathlib import Path
+
+try:
+    import orjson  # optional: ~5-10x faster encoding than the json module
+except ImportError:
+    orjson = None
+
+# === Shared writer/loader for pipeline artifacts ===
+#
+# The format is inferred from the file name unless given explicitly:
+#   cards.json        compact JSON
+#   cards.jsonl       JSON Lines (one record per line, top-level list only)
+#   cards.json.gz     gzip-compressed  (also .jsonl.gz)
+#   cards.json.zst    zstd-compressed  (requires `pip install zstandard`)
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def _infer_format(path, jsonl, compression):
+    suffixes = Path(path).suffixes
+    if compression is None and suffixes:
+        compression = COMPRESSION_SUFFIXES.get(suffixes[-1])
+    if jsonl is None:
+        jsonl = ".jsonl" in suffixes
+    return jsonl, compression
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("❌ zstd compression requires the `zstandard` package") from e
+    return zstandard
+
+
+def _dumps(obj, indent=None):
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    separators = None if indent else (",", ":")
+    return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def encode(data, jsonl=False, indent=None):
+    if jsonl:
+        if not isinstance(data, list):
+            raise TypeError(f"❌ JSON Lines output needs a list of records, got {type(data).__name__}")
+        return b"".join(_dumps(record) + b"\n" for record in data)
+    return _dumps(data, indent=indent)
+
+
+def decode(raw, jsonl=False):
+    if jsonl:
+        return [_loads(line) for line in raw.splitlines() if line.strip()]
+    return _loads(raw)
+
+
+def write_artifact(path, data, jsonl=None, compression=None, indent=None):
+    """
+    Write `data` to `path` as compact JSON (or JSON Lines), optionally
+    compressed with gzip or zstd. Pass `indent=2` for a human-readable file.
+    """
+    path = Path(path)
+    jsonl, compression = _infer_format(path, jsonl, compression)
+    raw = encode(data, jsonl=jsonl, indent=indent)
+
+    if compression == "gzip":
+        raw = gzip.compress(raw, compresslevel=6)
+    elif compression == "zstd":
+        raw = _zstd().ZstdCompressor(level=10).compress(raw)
+    elif compression is not None:
+        raise ValueError(f"❌ Unknown compression: {compression}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(raw)
+    return path
+
+
+def load_artifact(path, jsonl=None, compression=None):
+    """Load an artifact written by `write_artifact` (or any plain JSON file)."""
+    path = Path(path)
+    jsonl, compression = _infer_format(path, jsonl, compression)
+    raw = path.read_bytes()
+
+    if compression == "gzip":
+        raw = gzip.decompress(raw)
+    elif compression == "zstd":
+        raw = _zstd().ZstdDecompressor().stream_reader(raw).read()
+    elif compression is not None:
+        raise ValueError(f"❌ Unknown compression: {compression}")
+
+    return decode(raw, jsonl=jsonl)
+
+
+# === Oracle text table ===
+def intern_oracle_texts(entries, texts=None, key="oracle_text", ref_key="oracle_ref"):
+    """
+    Replace each entry's full oracle text with an index into a shared table so
+    every distinct text is stored once. Pass an existing `texts` list to share
+    one table across several outputs. Returns (entries, texts).
+    """
+    texts = [] if texts is None else texts
+    index = {t: i for i, t in enumerate(texts)}
+    interned = []
+    for entry in entries:
+        entry = dict(entry)
+        text = entry.pop(key)
+        ref = index.get(text)
+        if ref is None:
+            ref = index[text] = len(texts)
+            texts.append(text)
+        entry[ref_key] = ref
+        interned.append(entry)
+    return interned, texts
+
+
+def attach_oracle_texts(entries, texts, key="oracle_text", ref_key="oracle_ref"):
+    """Inverse of `intern_oracle_texts`: put full oracle text back on each entry."""
+    return [{**{k: v for k, v in e.items() if k != ref_key}, key: texts[e[ref_key]]} for e in entries]
+
+
+# === Sorted views ===
+def write_sort_index(path, entries, fields, source):
+    """
+    Write a sorted view of `entries` as a list of positions into `source`
+    instead of a second full copy. Sorting is case-insensitive on `fields`.
+    """
+    order = sorted(range(len(entries)), key=lambda i: tuple(entries[i][f].lower() for f in fields))
+    return write_artifact(path, {"source": Path(source).name, "sort_key": list(fields), "order": order})
+
+
+def load_sorted_view(index_path):
+    """Load a sort index and return its source entries in sorted order."""
+    index_path = Path(index_path)
+    index = load_artifact(index_path)
+    entries = load_artifact(index_path.parent / index["source"])
+    return [entries[i] for i in index["order"]]
@@ -0,0 +1,98 @@
+import re
+from pathlib import Path
+
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+DATA_RAW = ROOT / "data" / "raw"
+DATA_STATIC = ROOT / "data" / "static"
+
+COMPRULES_PDF = DATA_RAW / "MagicCompRules 20250404.pdf"
+
+# Sections that end the 701/702 keyword chapters
+STOP_SECTIONS = ["703", "Glossary", "Credits", "900", "905", "708", "800", "801", "710"]
+
+
+def open_pdf(pdf_path):
+    import fitz  # PyMuPDF, only needed when a PDF is actually parsed
+    return fitz.open(pdf_path)
+
+
+# === Collect <section>.* lines only ===
+def collect_section_lines(doc, section, stop_sections=STOP_SECTIONS):
+    start_re = re.compile(rf"^{section}\.\d+\.\s+[A-Z]")  # Start of a new keyword
+    stop_re = re.compile(rf"^({'|'.join(stop_sections)})\.")
+    any_re = re.compile(rf"^{section}\.")
+
+    lines = []
+    inside = False
+    for page in doc:
+        for line in page.get_text().split("\n"):
+            line = line.strip()
+            if start_re.match(line):
+                inside = True
+            elif stop_re.match(line):
+                inside = False
+            if inside or any_re.match(line):
+                lines.append(line)
+    return lines
+
+
+# === Helper to flush and format a rule entry ===
+def flush(code, buffer, section):
+    if not code or not buffer:
+        return None
+
+    entry = {"code": code, "name": None, "subsections": []}
+    for line in buffer:
+        header = re.match(rf"^{re.escape(code)}\.\s+([A-Z][a-zA-Z \-']+)", line)
+        if header:
+            entry["name"] = header.group(1).strip()
+            continue
+
+        sub = re.match(rf"^{re.escape(code)}[a-z]\s+(.*)", line)
+        if sub:
+            sub_id = re.match(rf"({re.escape(code)}[a-z])", line).group(1)
+            text = sub.group(1).strip()
+            entry["subsections"].append({"id": sub_id, "text": text})
+        elif entry["subsections"]:
+            # Ignore glossary-style lines like: "702.106, “Hidden Agenda.”"
+            if re.fullmatch(rf"{section}\.\d{{1,3}},.*", line):
+                continue
+            entry["subsections"][-1]["text"] += " " + line.strip()
+
+    return entry if entry["name"] else None
+
+
+# === Walk lines and group them by rule code ===
+def split_rule_buffers(lines, section):
+    start_re = re.compile(rf"^({section}\.\d+)\.\s+[A-Z]")
+    buffers = {}
+    current_code = None
+
+    for line in lines:
+        start = start_re.match(line)
+        if start:
+            current_code = start.group(1)
+            buffers[current_code] = [line]
+        elif current_code:
+            buffers[current_code].append(line)
+
+    return buffers
+
+
+def build_rule_entries(lines, section):
+    entries = {}
+    for code, buffer in split_rule_buffers(lines, section).items():
+        entry = flush(code, buffer, section)
+        if entry:
+            entries[code] = entry
+
+    # Remove <section>.1 (intro paragraph, not a mechanic)
+    entries.pop(f"{section}.1", None)
+    return entries
+
+
+def extract_keyword_rules(pdf_path, section, stop_sections=STOP_SECTIONS):
+    """Parse every `<section>.N` keyword rule from a CompRules PDF, keyed by rule code."""
+    lines = collect_section_lines(open_pdf(pdf_path), section, stop_sections)
+    return build_rule_entries(lines, section)
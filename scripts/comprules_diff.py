@@ -0,0 +1,154 @@
+import hashlib
+import json
+from pathlib import Path
+
+from artifact_writer import load_artifact, write_artifact
+from comprules import (
+    COMPRULES_PDF, DATA_STATIC, STOP_SECTIONS,
+    build_rule_entries, collect_section_lines, open_pdf,
+)
+
+# === Paths ===
+KEYWORD_ABILITIES_PATH = DATA_STATIC / "keyword_ability_rules_structured_clean.json"
+KEYWORD_ACTIONS_PATH = DATA_STATIC / "keyword_action_rules_structured_clean.json"
+GLOSSARY_PATH = DATA_STATIC / "glossary_terms_structured_clean.json"
+CHANGES_OUT = DATA_STATIC / "comprules_changed_mechanics.json"
+
+# section → (previous structured JSON, CompRules section, stop sections)
+KEYWORD_SECTIONS = {
+    "keyword_abilities": (KEYWORD_ABILITIES_PATH, "702", STOP_SECTIONS),
+    "keyword_actions": (KEYWORD_ACTIONS_PATH, "701", ["702", *STOP_SECTIONS]),
+}
+
+
+# === Hashing ===
+def _normalize_whitespace(value):
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, list):
+        return [_normalize_whitespace(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _normalize_whitespace(v) for k, v in value.items()}
+    return value
+
+
+def entry_hash(entry):
+    """
+    Stable hash of an entry's full structured text. Whitespace is collapsed so
+    PDF line-wrapping differences between releases don't count as changes.
+    """
+    raw = json.dumps(_normalize_whitespace(entry), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def index_glossary(entries):
+    """
+    Index glossary entries by term. Split bold spans can repeat a term (e.g.
+    "Card"), so repeats are keyed by occurrence: "Card", "Card #2", ...
+    """
+    index, seen = {}, {}
+    for entry in entries:
+        term = entry["term"]
+        seen[term] = seen.get(term, 0) + 1
+        index[term if seen[term] == 1 else f"{term} #{seen[term]}"] = entry
+    return index
+
+
+def glossary_mechanic_name(entry):
+    # Same normalization generate_full_mechanics_list applies to glossary terms
+    return entry.get("term", "").strip().title()
+
+
+# === Diffing ===
+def diff_entries(previous, current):
+    """
+    Compare two {key: entry} indexes by entry hash.
+    Returns {"added": [...], "changed": [...], "removed": [...]} of keys.
+    """
+    prev_hashes = {k: entry_hash(e) for k, e in previous.items()}
+    diff = {"added": [], "changed": [], "removed": []}
+    for key, entry in current.items():
+        if key not in prev_hashes:
+            diff["added"].append(key)
+        elif prev_hashes[key] != entry_hash(entry):
+            diff["changed"].append(key)
+    diff["removed"] = [k for k in previous if k not in current]
+    return diff
+
+
+def merge_entries(previous, current, diff):
+    """
+    Keep the previous entry for every unchanged key and take the newly
+    extracted entry only for added/changed keys, in the new PDF's order.
+    """
+    updated = set(diff["added"]) | set(diff["changed"])
+    return [current[k] if k in updated else previous[k] for k in current]
+
+
+def touched_names(previous, current, diff, name_fn):
+    """
+    Mechanic names affected by the diff. A changed entry contributes both its
+    old and new name, so a renamed rule also drops the stale mechanic downstream.
+    """
+    names = [name_fn(current[k]) for k in diff["added"] + diff["changed"]]
+    names += [name_fn(previous[k]) for k in diff["changed"] + diff["removed"]]
+    return names
+
+
+# === Sections ===
+def diff_keyword_section(doc, previous_path, section, stop_sections):
+    previous = {e["code"]: e for e in load_artifact(previous_path)}
+    current = build_rule_entries(collect_section_lines(doc, section, stop_sections), section)
+    diff = diff_entries(previous, current)
+    names = touched_names(previous, current, diff, lambda e: e["name"])
+    return previous, current, diff, names
+
+
+def diff_glossary(doc, previous_path):
+    from extract_glossary_terms import parse_glossary
+
+    previous = index_glossary(load_artifact(previous_path))
+    current = index_glossary(parse_glossary(doc))
+    diff = diff_entries(previous, current)
+    names = touched_names(previous, current, diff, glossary_mechanic_name)
+    return previous, current, diff, names
+
+
+def diff_comprules(pdf_path=COMPRULES_PDF, write=True, changes_path=CHANGES_OUT):
+    """
+    Diff a new CompRules PDF against the stored 701/702/glossary JSON by rule
+    code and glossary term. Only added/changed/removed entries are rewritten;
+    the names of the touched mechanics are saved to `changes_path` and returned.
+    """
+    doc = open_pdf(pdf_path)
+    report = {"pdf": Path(pdf_path).name, "sections": {}, "changed_mechanics": []}
+    outputs = {}
+
+    for label, (path, section, stop_sections) in KEYWORD_SECTIONS.items():
+        outputs[label] = (path, *diff_keyword_section(doc, path, section, stop_sections))
+    outputs["glossary"] = (GLOSSARY_PATH, *diff_glossary(doc, GLOSSARY_PATH))
+
+    names = []
+    for label, (path, previous, current, diff, section_names) in outputs.items():
+        report["sections"][label] = diff
+        names += section_names
+        counts = ", ".join(f"{len(v)} {k}" for k, v in diff.items())
+        print(f"🔍 {label}: {counts}")
+
+        if write and any(diff.values()):
+            write_artifact(path, merge_entries(previous, current, diff))
+            print(f"📁 Rewrote {path.name}")
+
+    report["changed_mechanics"] = sorted(set(names))
+    if write:
+        write_artifact(changes_path, report)
+    print(f"✅ {len(report['changed_mechanics'])} mechanics changed in {report['pdf']}")
+    return report["changed_mechanics"]
+
+
+def load_changed_mechanics(changes_path=CHANGES_OUT):
+    if not Path(changes_path).exists():
+        raise FileNotFoundError(
+            f"❌ Could not find changed mechanics at {changes_path} (run `pipeline.py comprules-diff` first)"
+        )
+    return load_artifact(changes_path)["changed_mechanics"]
@@ -1,11 +1,14 @@
-import json
 from pathlib import Path
 
-# === Step 1: Load trimmed (full printing) card set
-with open("../data/raw/scryfall_cards_trimmed_for_ml.json") as f:
-    all_cards = json.load(f)
+from artifact_writer import load_artifact, write_artifact
 
-# === Step 2: Deduplicate cards by rules identity, keeping alt art/flavor
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+INPUT_PATH = ROOT / "data" / "raw" / "scryfall_cards_trimmed_for_ml.json"
+OUTPUT_PATH = ROOT / "data" / "raw" / "scryfall_cards_deduplicated_for_ml.json"
+
+
+# === Deduplicate cards by rules identity, keeping alt art/flavor
 def deduplicate_by_rules(cards):
     seen = {}
     deduped = []
@@ -30,12 +33,17 @@ def deduplicate_by_rules(cards):
 
     return deduped
 
-deduped_cards = deduplicate_by_rules(all_cards)
 
-# === Step 3: Save result
-output_path = Path("../data/raw/scryfall_cards_deduplicated_for_ml.json")
-with open(output_path, "w") as f:
-    json.dump(deduped_cards, f, indent=2)
+def deduplicate_trimmed_scryfall_cards(input_path=INPUT_PATH, output_path=OUTPUT_PATH):
+    # Load trimmed (full printing) card set, deduplicate, save
+    all_cards = load_artifact(input_path)
+    deduped_cards = deduplicate_by_rules(all_cards)
+    write_artifact(output_path, deduped_cards)
+
+    print(f"✅ Deduplicated: reduced from {len(all_cards)} → {len(deduped_cards)} cards")
+    print(f"📁 Saved to {output_path}")
+    return deduped_cards
+
 
-print(f"✅ Deduplicated: reduced from {len(all_cards)} → {len(deduped_cards)} cards")
-print(f"📁 Saved to {output_path}")
+if __name__ == "__main__":
+    deduplicate_trimmed_scryfall_cards()
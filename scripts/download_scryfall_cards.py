@@ -1,23 +1,37 @@
-import requests
-import json
 from pathlib import Path
 
-# Get the bulk data index
-bulk_info = requests.get("https://api.scryfall.com/bulk-data").json()
+from artifact_writer import write_artifact
 
-# Find the default_cards entry
-default_entry = next(item for item in bulk_info["data"] if item["type"] == "default_cards")
-download_url = default_entry["download_uri"]
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_PATH = ROOT / "data" / "raw" / "scryfall_full_cards.json"
 
-print(f"📥 Downloading from {download_url}")
-response = requests.get(download_url)
+BULK_DATA_URL = "https://api.scryfall.com/bulk-data"
 
-# Save full card data (list of dicts)
-raw_cards = response.json()
-output_path = Path("../data/raw/scryfall_full_cards.json")
-output_path.parent.mkdir(parents=True, exist_ok=True)
 
-with open(output_path, "w", encoding="utf-8") as f:
-    json.dump(raw_cards, f, indent=2)
+def fetch_default_cards():
+    """Download the Scryfall `default_cards` bulk set (list of dicts)."""
+    import requests
 
-print(f"✅ Saved full Scryfall card data to {output_path}")
+    # Get the bulk data index
+    bulk_info = requests.get(BULK_DATA_URL).json()
+
+    # Find the default_cards entry
+    default_entry = next(item for item in bulk_info["data"] if item["type"] == "default_cards")
+    download_url = default_entry["download_uri"]
+
+    print(f"📥 Downloading from {download_url}")
+    return requests.get(download_url).json()
+
+
+def download_scryfall_cards(output_path=OUTPUT_PATH):
+    # Save full card data (list of dicts)
+    raw_cards = fetch_default_cards()
+    write_artifact(output_path, raw_cards)
+
+    print(f"✅ Saved full Scryfall card data to {output_path}")
+    return raw_cards
+
+
+if __name__ == "__main__":
+    download_scryfall_cards()
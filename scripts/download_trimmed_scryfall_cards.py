@@ -1,15 +1,14 @@
-import requests
-import json
 from pathlib import Path
 
-# === Step 1: Download the full "default_cards" Scryfall bulk data set
-bulk_index = requests.get("https://api.scryfall.com/bulk-data").json()
-bulk_url = next(entry for entry in bulk_index["data"] if entry["type"] == "default_cards")["download_uri"]
+from artifact_writer import write_artifact
+from download_scryfall_cards import fetch_default_cards
 
-print(f"📥 Downloading all card data from: {bulk_url}")
-all_cards = requests.get(bulk_url).json()
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_PATH = ROOT / "data" / "raw" / "scryfall_cards_trimmed_for_ml.json"
 
-# === Step 2: Define which fields to keep for ML and generation
+
+# === Define which fields to keep for ML and generation
 def extract_trimmed_fields(card):
     """
     Extract only the fields relevant for ML model training:
@@ -50,19 +49,24 @@ def extract_trimmed_fields(card):
 
     return trimmed
 
-# === Step 3: Filter and trim each card
-cards_for_model = [
-    extract_trimmed_fields(card)
-    for card in all_cards
-    if "oracle_text" in card or "card_faces" in card
-]
 
-# === Step 4: Save result
-output_dir = Path("../data/raw")
-output_dir.mkdir(parents=True, exist_ok=True)
-output_file = output_dir / "scryfall_cards_trimmed_for_ml.json"
+def trim_cards(all_cards):
+    """Filter to cards with rules text and trim each to its ML fields."""
+    return [
+        extract_trimmed_fields(card)
+        for card in all_cards
+        if "oracle_text" in card or "card_faces" in card
+    ]
+
+
+def download_trimmed_scryfall_cards(output_path=OUTPUT_PATH):
+    # Download the full "default_cards" Scryfall bulk data set, then trim it
+    cards_for_model = trim_cards(fetch_default_cards())
+    write_artifact(output_path, cards_for_model)
+
+    print(f"✅ Saved {len(cards_for_model)} cards to {output_path}")
+    return cards_for_model
 
-with open(output_file, "w") as f:
-    json.dump(cards_for_model, f, indent=2)
 
-print(f"✅ Saved {len(cards_for_model)} cards to {output_file}")
+if __name__ == "__main__":
+    download_trimmed_scryfall_cards()
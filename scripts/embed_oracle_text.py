@@ -0,0 +1,46 @@
+from pathlib import Path
+
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+DATA_PROCESSED = ROOT / "data" / "processed"
+ENRICHED_PATH = DATA_PROCESSED / "enriched_cards.csv"
+OUTPUT_PATH = DATA_PROCESSED / "text_embeddings.npy"
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+def embed_texts(texts, model_name=MODEL_NAME, show_progress_bar=True):
+    """Embed oracle text into 384-dim vectors with a pretrained Sentence Transformer."""
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+    return np.array(model.encode(texts, show_progress_bar=show_progress_bar))
+
+
+def embed_oracle_text(enriched_path=ENRICHED_PATH, output_path=OUTPUT_PATH):
+    """Script version of 2_text_embeddings.ipynb."""
+    import numpy as np
+    import pandas as pd
+
+    # === Load enriched card data ===
+    if not enriched_path.exists():
+        raise FileNotFoundError(f"❌ Could not find enriched dataset at {enriched_path}")
+
+    df = pd.read_csv(enriched_path)
+    texts = df["oracle_text"].fillna("").tolist()
+    print(f"✅ Loaded {len(texts)} oracle text entries.")
+
+    # === Load transformer model and encode ===
+    print("⚙️ Generating embeddings (this may take a few minutes)...")
+    embeddings = embed_texts(texts)
+    print("✅ Embeddings shape:", embeddings.shape)
+
+    # === Save embeddings ===
+    np.save(output_path, embeddings)
+    print(f"✅ Saved embeddings to {output_path}")
+    return embeddings
+
+
+if __name__ == "__main__":
+    embed_oracle_text()
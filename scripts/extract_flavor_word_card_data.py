@@ -1,31 +1,19 @@
-import json
 import re
+from collections import Counter
 from pathlib import Path
 
-# === Config ===
-CARDS_PATH = Path("../data/raw/scryfall_full_cards.json")
-KEYWORDS_PATH = Path("../data/raw/MTGJSON/Keywords.json")
-
-CLEAN_OUT = Path("../data/static/flavor_words_card_level.json")
-SORTED_OUT = Path("../data/static/flavor_words_card_level_sorted.json")
-REJECTED_OUT = Path("../data/static/flavor_words_rejected.json")
-
-# === Load Data ===
-with open(CARDS_PATH, encoding="utf-8") as f:
-    cards = json.load(f)
-
-with open(KEYWORDS_PATH, encoding="utf-8") as f:
-    keywords_data = json.load(f)["data"]
+from artifact_writer import intern_oracle_texts, load_artifact, write_artifact, write_sort_index
+from extract_ability_word_card_data import load_keywords
 
-# === All known mechanic-related words (ability words, keyword abilities, actions)
-mechanic_words_set = {
-    w.lower()
-    for section in ["abilityWords", "keywordAbilities", "keywordActions"]
-    for w in keywords_data.get(section, [])
-}
+# === Config ===
+ROOT = Path(__file__).resolve().parent.parent
+CARDS_PATH = ROOT / "data" / "raw" / "scryfall_full_cards.json"
+KEYWORDS_PATH = ROOT / "data" / "raw" / "MTGJSON" / "Keywords.json"
 
-# Add manual exclusions if needed (e.g. "visit" missed in JSON)
-mechanic_words_set.update({"visit"})
+CLEAN_OUT = ROOT / "data" / "static" / "flavor_words_card_level.json"
+SORTED_OUT = ROOT / "data" / "static" / "flavor_words_card_level_sort_index.json"
+REJECTED_OUT = ROOT / "data" / "static" / "flavor_words_rejected.json"
+ORACLE_OUT = ROOT / "data" / "static" / "flavor_words_oracle_texts.json"
 
 # === Filters
 ROMAN_NUMERALS = {"I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X"}
@@ -34,78 +22,161 @@ COST_PREFIXES = {"sacrifice", "discard", "pay", "exile", "tap", "untap"}
 # === Regex for flavor-word-like headers
 flavor_header_re = re.compile(r"^([A-Z][\w'’\- /]{1,40})\s*(—|:)\s+")
 
-# === Output holders
-cleaned = []
-rejected = []
 
-# === Extraction + Cleaning
-for card in cards:
-    if card.get("set_type", "") == "minigame":
-        print(f"Skipping minigame card: {card['name']}")
-        continue
-
-    faces = card.get("card_faces", [card])
-    for face in faces:
-        name = face.get("name", card.get("name", ""))
-        oracle = face.get("oracle_text", "")
-        if not oracle:
+def build_mechanic_words(keywords_data):
+    """All known mechanic-related words (ability words, keyword abilities, actions)."""
+    mechanic_words_set = {
+        w.lower()
+        for section in ["abilityWords", "keywordAbilities", "keywordActions"]
+        for w in keywords_data.get(section, [])
+    }
+
+    # Add manual exclusions if needed (e.g. "visit" missed in JSON)
+    mechanic_words_set.update({"visit"})
+    return mechanic_words_set
+
+
+# === Rejection rules, precompiled
+bad_chars_re = re.compile(r"[0-9]|[^\w\s'\-/]")  # digits or bad punctuation
+
+
+def header_lines(oracle):
+    """Every (full_line, candidate, header) flavor-word-like header in one oracle text."""
+    headers = []
+    for line in oracle.split("\n"):
+        # Cheap pre-check: every header needs an em dash or colon
+        if "—" not in line and ":" not in line:
+            continue
+        stripped = line.strip()
+        match = flavor_header_re.match(stripped)
+        if match:
+            headers.append((stripped, match.group(1).strip(), match.group(0)))
+    return headers
+
+
+def collect_header_lines(cards, skipped):
+    """
+    Stage 1: gather every header line as (name, oracle, full_line, candidate,
+    header). Printings share oracle text, so each distinct text is scanned once.
+    """
+    rows = []
+    cache = {}
+    for card in cards:
+        if card.get("set_type", "") == "minigame":
+            skipped["minigame"] += 1
             continue
 
-        for line in oracle.split("\n"):
-            stripped = line.strip()
-            match = flavor_header_re.match(stripped)
-            if not match:
+        faces = card.get("card_faces", [card])
+        for face in faces:
+            name = face.get("name", card.get("name", ""))
+            oracle = face.get("oracle_text", "")
+            if not oracle:
                 continue
 
-            candidate = match.group(1).strip()
-            candidate_lower = candidate.lower()
-            reason = None
-
-            # --- Filtering Logic ---
-            if candidate_lower in mechanic_words_set:
-                reason = "Mechanic word"
-            elif candidate in ROMAN_NUMERALS:
-                reason = "Saga chapter numeral"
-            elif "{" in match.group(0):
-                reason = "Contains mana cost"
-            elif candidate.split()[0].lower() in COST_PREFIXES:
-                reason = "Starts with cost word"
-            elif candidate_lower == name.lower():
-                reason = "Matches card name"
-            elif len(candidate.split()) > 5:
-                reason = "Too many words"
-            elif re.search(r"[0-9]", candidate) or re.search(r'[^\w\s\'\-/]', candidate):
-                reason = "Contains digits or bad punctuation"
-            elif not candidate[0].isupper():
-                reason = "Does not start with capital letter"
-
-            if reason:
-                rejected.append({**{
-                    "card_name": name,
-                    "flavor_word": candidate,
-                    "full_line": stripped,
-                    "oracle_text": oracle
-                }, "reject_reason": reason})
-            else:
-                cleaned.append({
-                    "card_name": name,
-                    "flavor_word": candidate,
-                    "full_line": stripped,
-                    "oracle_text": oracle
-                })
-
-# === Save Outputs
-CLEAN_OUT.parent.mkdir(parents=True, exist_ok=True)
-
-with open(CLEAN_OUT, "w", encoding="utf-8") as f:
-    json.dump(cleaned, f, indent=2, ensure_ascii=False)
-
-with open(SORTED_OUT, "w", encoding="utf-8") as f:
-    json.dump(sorted(cleaned, key=lambda x: (x["flavor_word"].lower(), x["card_name"].lower())), f, indent=2, ensure_ascii=False)
-
-with open(REJECTED_OUT, "w", encoding="utf-8") as f:
-    json.dump(rejected, f, indent=2, ensure_ascii=False)
-
-# === Report
-print(f"✅ Extracted {len(cleaned)} cleaned flavor word entries")
-print(f"❌ Rejected {len(rejected)} entries → {REJECTED_OUT.name}")
+            headers = cache.get(oracle)
+            if headers is None:
+                headers = cache[oracle] = header_lines(oracle)
+            for stripped, candidate, header in headers:
+                rows.append((name, oracle, stripped, candidate, header))
+    return rows
+
+
+def candidate_reasons(candidate, header, mechanic_words_set):
+    """
+    Reject reasons that don't depend on the card name, split around the
+    "Matches card name" check so the rule order stays the same.
+    """
+    words = candidate.split()
+    before = None
+    if candidate.lower() in mechanic_words_set:
+        before = "Mechanic word"
+    elif candidate in ROMAN_NUMERALS:
+        before = "Saga chapter numeral"
+    elif "{" in header:
+        before = "Contains mana cost"
+    elif words[0].lower() in COST_PREFIXES:
+        before = "Starts with cost word"
+
+    after = None
+    if len(words) > 5:
+        after = "Too many words"
+    elif bad_chars_re.search(candidate):
+        after = "Contains digits or bad punctuation"
+    elif not candidate[0].isupper():
+        after = "Does not start with capital letter"
+    return before, after
+
+
+# === Extraction + Cleaning
+def filter_flavor_words(cards, mechanic_words_set, skipped=None):
+    """
+    Split header lines into cleaned flavor words and rejected entries (with a
+    `reject_reason`). Skipped cards are counted in `skipped`, not printed.
+    """
+    skipped = Counter() if skipped is None else skipped
+    rows = collect_header_lines(cards, skipped)
+
+    # Stage 2: evaluate the name-independent rules once per distinct candidate
+    reasons = {}
+    for _, _, _, candidate, header in rows:
+        key = (candidate, header)
+        if key not in reasons:
+            reasons[key] = candidate_reasons(candidate, header, mechanic_words_set)
+
+    # Stage 3: per-row card-name check, then split into cleaned / rejected
+    cleaned = []
+    rejected = []
+    for name, oracle, stripped, candidate, header in rows:
+        before, after = reasons[(candidate, header)]
+        if before:
+            reason = before
+        elif candidate.lower() == name.lower():
+            reason = "Matches card name"
+        else:
+            reason = after
+
+        entry = {
+            "card_name": name,
+            "flavor_word": candidate,
+            "full_line": stripped,
+            "oracle_text": oracle
+        }
+        if reason:
+            entry["reject_reason"] = reason
+            rejected.append(entry)
+        else:
+            cleaned.append(entry)
+
+    return cleaned, rejected
+
+
+def extract_flavor_word_card_data(cards_path=CARDS_PATH, keywords_path=KEYWORDS_PATH):
+    # === Load Data ===
+    cards = load_artifact(cards_path)
+    mechanic_words_set = build_mechanic_words(load_keywords(keywords_path))
+    skipped = Counter()
+    cleaned, rejected = filter_flavor_words(cards, mechanic_words_set, skipped)
+
+    # === Save Outputs
+    # Cleaned and rejected entries share one oracle text table, referenced by `oracle_ref`
+    cleaned, oracle_texts = intern_oracle_texts(cleaned)
+    rejected, oracle_texts = intern_oracle_texts(rejected, oracle_texts)
+
+    write_artifact(CLEAN_OUT, cleaned)
+    write_artifact(REJECTED_OUT, rejected)
+    write_artifact(ORACLE_OUT, oracle_texts)
+    write_sort_index(SORTED_OUT, cleaned, ["flavor_word", "card_name"], CLEAN_OUT)
+
+    # === Report
+    print(f"✅ Extracted {len(cleaned)} cleaned flavor word entries")
+    print(f"❌ Rejected {len(rejected)} entries → {REJECTED_OUT.name}")
+    for reason, count in Counter(e["reject_reason"] for e in rejected).most_common():
+        print(f"   {count:>6}  {reason}")
+    for reason, count in skipped.items():
+        print(f"⏭️ Skipped {count} {reason} cards")
+    print(f"📁 {len(oracle_texts)} unique oracle texts → {ORACLE_OUT.name}")
+    return cleaned, rejected
+
+
+if __name__ == "__main__":
+    extract_flavor_word_card_data()
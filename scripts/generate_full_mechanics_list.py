@@ -1,41 +1,43 @@
-import json
 import re
 import unicodedata
 from pathlib import Path
 
+from artifact_writer import load_artifact, write_artifact
+
 # === Paths ===
-STATIC = Path("../data/static")
-RAW = Path("../data/raw/scryfall_cards_deduplicated_for_ml.json")
+ROOT = Path(__file__).resolve().parent.parent
+STATIC = ROOT / "data" / "static"
+RAW = ROOT / "data" / "raw" / "scryfall_cards_deduplicated_for_ml.json"
+OUTPUT_PATH = STATIC / "ml_ready_mechanics.json"
 
 # === Helpers ===
-def load_json(p):
-    with open(p, encoding="utf-8") as f:
-        return json.load(f)
-
 def normalize(text):
     text = unicodedata.normalize("NFKC", text)
     return text.lower().replace("\n", " ").replace("—", "-").strip()
 
 # === Load inputs ===
-scryfall = load_json(RAW)
-keyword_abilities = load_json(STATIC / "keyword_ability_rules_structured_clean.json")
-keyword_actions = load_json(STATIC / "keyword_action_rules_structured_clean.json")
-glossary = load_json(STATIC / "glossary_terms_structured_clean.json")
-ability_words = load_json(STATIC / "ability_words_card_level.json")
-flavor_words = load_json(STATIC / "flavor_words_card_level.json")
-subset_patch = load_json(STATIC / "scryfall_subset_patch.json")
+def load_inputs(static=STATIC, raw=RAW):
+    return {
+        "scryfall": load_artifact(raw),
+        "keyword_abilities": load_artifact(static / "keyword_ability_rules_structured_clean.json"),
+        "keyword_actions": load_artifact(static / "keyword_action_rules_structured_clean.json"),
+        "glossary": load_artifact(static / "glossary_terms_structured_clean.json"),
+        "ability_words": load_artifact(static / "ability_words_card_level.json"),
+        "flavor_words": load_artifact(static / "flavor_words_card_level.json"),
+        "subset_patch": load_artifact(static / "scryfall_subset_patch.json"),
+    }
 
 # === Build Oracle text index ===
-oracle_index = []
-for card in scryfall:
-    if "oracle_text" in card:
-        oracle_index.append({"name": card["name"], "oracle": card["oracle_text"]})
-    elif "card_faces" in card:
-        for face in card["card_faces"]:
-            if face.get("oracle_text"):
-                oracle_index.append({"name": face["name"], "oracle": face["oracle_text"]})
-
-oracle_blob = " ".join(normalize(c["oracle"]) for c in oracle_index)
+def build_oracle_index(scryfall):
+    oracle_index = []
+    for card in scryfall:
+        if "oracle_text" in card:
+            oracle_index.append({"name": card["name"], "oracle": card["oracle_text"]})
+        elif "card_faces" in card:
+            for face in card["card_faces"]:
+                if face.get("oracle_text"):
+                    oracle_index.append({"name": face["name"], "oracle": face["oracle_text"]})
+    return oracle_index
 
 # === Manual match overrides ===
 manual_match_terms = {
@@ -46,7 +48,7 @@ manual_match_terms = {
 }
 
 # === Matching logic ===
-def get_card_matches(name):
+def get_card_matches(name, oracle_index, subset_patch):
     name_lc = name.lower().strip()
     terms = manual_match_terms.get(name_lc, [name_lc])
     matches = set()
@@ -75,73 +77,79 @@ def get_card_matches(name):
     return []
 
 # === Mechanic builder ===
-all_mechanics = []
-
 def get_def(entry):
     if "subsections" in entry and entry["subsections"]:
         return " ".join(s.get("text", "") for s in entry["subsections"]).strip()
     return entry.get("text", "").strip()
 
-def add(entry, type_):
-    name = entry.get("name") or entry.get("term")
-    rule = entry.get("code")
-    definition = get_def(entry) or f"{name} is a {type_.lower()} in Magic: The Gathering."
-    cards = get_card_matches(name)
-    cards = list(set(cards))  # dedupe cards
-    all_mechanics.append({
-        "name": name,
-        "type": type_,
-        "rule_code": rule,
-        "definition": definition,
-        "oracle_phrase_match": name.lower(),
-        "card_count": len(cards),
-        "cards": cards[:10]
-    })
-
-for e in keyword_abilities:
-    add(e, "Keyword Ability")
-for e in keyword_actions:
-    add(e, "Keyword Action")
-
-def add_words(source, key, label, desc):
-    word_map = {}
-    for entry in source:
-        word = entry[key].strip().title()
-        word_map.setdefault(word, []).append(entry["card_name"])
-    for word, cards in word_map.items():
-        cards = list(set(cards))  # dedupe
-        all_mechanics.append({
-            "name": word,
-            "type": label,
-            "rule_code": None,
-            "definition": desc,
-            "oracle_phrase_match": word.lower(),
-            "card_count": len(cards),
-            "cards": cards[:10]
-        })
-
-add_words(ability_words, "ability_word", "Ability Word",
-          "Ability words appear in italics at the beginning of an ability and have no rules meaning.")
-add_words(flavor_words, "flavor_word", "Flavor Word",
-          "Flavor words appear in italics before a rule line and are purely descriptive.")
-
-# === Glossary additions ===
-for entry in glossary:
-    name = entry.get("term", "").strip().title()
-    definition = entry.get("definition(s)") or entry.get("definitions", "") or f"{name} is a glossary term."
-    if re.search(rf"\b{re.escape(name.lower())}\b", oracle_blob):
-        cards = get_card_matches(name)
-        cards = list(set(cards))
+def build_mechanics(inputs):
+    oracle_index = build_oracle_index(inputs["scryfall"])
+    oracle_blob = " ".join(normalize(c["oracle"]) for c in oracle_index)
+    subset_patch = inputs["subset_patch"]
+    all_mechanics = []
+
+    def add(entry, type_):
+        name = entry.get("name") or entry.get("term")
+        rule = entry.get("code")
+        definition = get_def(entry) or f"{name} is a {type_.lower()} in Magic: The Gathering."
+        cards = get_card_matches(name, oracle_index, subset_patch)
+        cards = list(set(cards))  # dedupe cards
         all_mechanics.append({
             "name": name,
-            "type": "Glossary Term",
-            "rule_code": None,
-            "definition": definition if isinstance(definition, str) else " ".join(definition),
+            "type": type_,
+            "rule_code": rule,
+            "definition": definition,
             "oracle_phrase_match": name.lower(),
             "card_count": len(cards),
             "cards": cards[:10]
         })
 
+    for e in inputs["keyword_abilities"]:
+        add(e, "Keyword Ability")
+    for e in inputs["keyword_actions"]:
+        add(e, "Keyword Action")
+
+    def add_words(source, key, label, desc):
+        word_map = {}
+        for entry in source:
+            word = entry[key].strip().title()
+            word_map.setdefault(word, []).append(entry["card_name"])
+        for word, cards in word_map.items():
+            cards = list(set(cards))  # dedupe
+            all_mechanics.append({
+                "name": word,
+                "type": label,
+                "rule_code": None,
+                "definition": desc,
+                "oracle_phrase_match": word.lower(),
+                "card_count": len(cards),
+                "cards": cards[:10]
+            })
+
+    add_words(inputs["ability_words"], "ability_word", "Ability Word",
+              "Ability words appear in italics at the beginning of an ability and have no rules meaning.")
+    add_words(inputs["flavor_words"], "flavor_word", "Flavor Word",
+              "Flavor words appear in italics before a rule line and are purely descriptive.")
+
+    # === Glossary additions ===
+    for entry in inputs["glossary"]:
+        name = entry.get("term", "").strip().title()
+        definition = entry.get("definition(s)") or entry.get("definitions", "") or f"{name} is a glossary term."
+        if re.search(rf"\b{re.escape(name.lower())}\b", oracle_blob):
+            cards = get_card_matches(name, oracle_index, subset_patch)
+            cards = list(set(cards))
+            all_mechanics.append({
+                "name": name,
+                "type": "Glossary Term",
+                "rule_code": None,
+                "definition": definition if isinstance(definition, str) else " ".join(definition),
+                "oracle_phrase_match": name.lower(),
+                "card_count": len(cards),
+                "cards": cards[:10]
+            })
+
+    return all_mechanics
+
 # === Deduplication logic ===
 priority = {
     "Keyword Ability": 0,
@@ -150,19 +158,65 @@ priority = {
     "Flavor Word": 3,
     "Glossary Term": 4
 }
-deduped = {}
-for mech in all_mechanics:
-    name = mech["name"]
-    if name not in deduped:
-        deduped[name] = mech
-    else:
-        existing = deduped[name]
-        if priority[mech["type"]] < priority[existing["type"]] or \
-           (priority[mech["type"]] == priority[existing["type"]] and len(mech["definition"]) > len(existing["definition"])):
+
+def dedupe_mechanics(all_mechanics):
+    deduped = {}
+    for mech in all_mechanics:
+        name = mech["name"]
+        if name not in deduped:
             deduped[name] = mech
+        else:
+            existing = deduped[name]
+            if priority[mech["type"]] < priority[existing["type"]] or \
+               (priority[mech["type"]] == priority[existing["type"]] and len(mech["definition"]) > len(existing["definition"])):
+                deduped[name] = mech
+    return list(deduped.values())
+
+def restrict_inputs(inputs, names):
+    """Keep only the rule/word entries that produce one of the given mechanic names."""
+    names = set(names)
+    restricted = dict(inputs)
+    for key in ["keyword_abilities", "keyword_actions"]:
+        restricted[key] = [e for e in inputs[key] if (e.get("name") or e.get("term")) in names]
+    restricted["glossary"] = [e for e in inputs["glossary"] if e.get("term", "").strip().title() in names]
+    restricted["ability_words"] = [e for e in inputs["ability_words"] if e["ability_word"].strip().title() in names]
+    restricted["flavor_words"] = [e for e in inputs["flavor_words"] if e["flavor_word"].strip().title() in names]
+    return restricted
+
+def regenerate_mechanics(names, existing, inputs):
+    """
+    Rebuild only the named mechanics and splice them into `existing`:
+    rebuilt names are replaced in place, new names appended, and names
+    that no longer produce a mechanic are dropped.
+    """
+    names = set(names)
+    rebuilt = {m["name"]: m for m in dedupe_mechanics(build_mechanics(restrict_inputs(inputs, names)))}
+    mechanics = []
+    for mech in existing:
+        if mech["name"] not in names:
+            mechanics.append(mech)
+        elif mech["name"] in rebuilt:
+            mechanics.append(rebuilt.pop(mech["name"]))
+    return mechanics + list(rebuilt.values())
+
+def generate_full_mechanics_list(static=STATIC, raw=RAW, output_path=OUTPUT_PATH, only=None):
+    """
+    Build ml_ready_mechanics.json. With `only` (e.g. the changed names from
+    comprules_diff), regenerate just those mechanics in the existing output.
+    """
+    inputs = load_inputs(static, raw)
+    if only is not None and Path(output_path).exists():
+        mechanics = regenerate_mechanics(only, load_artifact(output_path), inputs)
+        print(f"🔁 Regenerated {len(set(only))} changed mechanics")
+    else:
+        mechanics = dedupe_mechanics(build_mechanics(inputs))
+
+    # === Output
+    write_artifact(output_path, mechanics)
+
+    print(f"✅ Wrote {len(mechanics)} deduplicated mechanics to {Path(output_path).name}")
+    return mechanics
 
-# === Output
-with open(STATIC / "ml_ready_mechanics.json", "w") as f:
-    json.dump(list(deduped.values()), f, indent=2)
 
-print(f"✅ Wrote {len(deduped)} deduplicated mechanics to ml_ready_mechanics.json")
+if __name__ == "__main__":
+    generate_full_mechanics_list()
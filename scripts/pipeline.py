@@ -0,0 +1,184 @@
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+# === Stages ===
+# subcommand → (module, function, help). Modules are imported only when their
+# subcommand runs, so `--help` and cheap stages never load fitz, requests,
+# sentence_transformers, umap or seaborn.
+STAGES = {
+    "download": ("download_scryfall_cards", "download_scryfall_cards",
+                 "Download full Scryfall default_cards set"),
+    "trim": ("download_trimmed_scryfall_cards", "download_trimmed_scryfall_cards",
+             "Download and keep only ML-relevant card fields"),
+    "dedupe": ("deduplicate_trimmed_scryfall_cards", "deduplicate_trimmed_scryfall_cards",
+               "Deduplicate trimmed cards by oracle identity"),
+    "subset-patch": ("scryfall_mechanic_subset_bug", "scryfall_mechanic_subset_patch",
+                     "Query Scryfall for under-detected mechanics"),
+    "keyword-abilities": ("extract_clean_split_keyword_ability_rules", "extract_keyword_abilities",
+                          "Parse 702.* keyword abilities from the CompRules PDF"),
+    "keyword-actions": ("extract_clean_split_keyword_action_rules", "extract_keyword_actions",
+                        "Parse 701.* keyword actions from the CompRules PDF"),
+    "glossary": ("extract_glossary_terms", "extract_glossary_terms",
+                 "Extract glossary terms from the CompRules PDF"),
+    "ability-words": ("extract_ability_word_card_data", "extract_ability_word_card_data",
+                      "Extract ability word lines from oracle text"),
+    "flavor-words": ("extract_flavor_word_card_data", "extract_flavor_word_card_data",
+                     "Extract and filter flavor words"),
+    "mechanics": ("generate_full_mechanics_list", "generate_full_mechanics_list",
+                  "Combine structured inputs into ml_ready_mechanics.json"),
+    "comprules-diff": ("comprules_diff", "diff_comprules",
+                       "Diff a new CompRules PDF and rewrite only changed 701/702/glossary entries"),
+    "embed": ("embed_oracle_text", "embed_oracle_text",
+              "Embed enriched oracle text with all-MiniLM-L6-v2"),
+    "umap": ("plot_umap", "plot_umap",
+             "Reduce embeddings with UMAP and save the visualizations"),
+}
+
+# Same order as run_full_mechanic_pipeline.sh
+FULL_PIPELINE = [
+    "download", "trim", "dedupe", "subset-patch",
+    "keyword-abilities", "keyword-actions", "glossary",
+    "ability-words", "flavor-words", "mechanics",
+]
+
+
+def run_stage(name, **kwargs):
+    module_name, func_name, _ = STAGES[name]
+    start = time.perf_counter()
+    func = getattr(importlib.import_module(module_name), func_name)
+    result = func(**kwargs)
+    print(f"⏱️ {name} finished in {time.perf_counter() - start:.2f}s")
+    return result
+
+
+def run_comprules_diff(pdf, regenerate):
+    kwargs = {"pdf_path": pdf} if pdf else {}
+    changed = run_stage("comprules-diff", **kwargs)
+    if regenerate and changed:
+        # Pass only the changed mechanic names downstream
+        run_stage("mechanics", only=changed)
+
+
+def run_mechanics(only_changed):
+    if only_changed:
+        from comprules_diff import load_changed_mechanics
+        try:
+            changed = load_changed_mechanics()
+        except FileNotFoundError as e:
+            sys.exit(str(e))
+        run_stage("mechanics", only=changed)
+    else:
+        run_stage("mechanics")
+
+
+def run_predict(argv):
+    from predict_mechanics import main
+    main(argv)
+
+
+# === Import-time report ===
+def parse_importtime(stderr):
+    """Parse `python -X importtime` output into (module, self_us, cumulative_us, depth)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2  # two spaces per nesting level
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def stage_modules(stage):
+    """Modules a subcommand imports when it runs."""
+    if stage == "all":
+        return [STAGES[name][0] for name in FULL_PIPELINE]
+    if stage == "predict":
+        return ["predict_mechanics"]
+    return [STAGES[stage][0]]
+
+
+def import_report(stage=None, module=None, top=15):
+    if stage and not module:
+        module = ", ".join(stage_modules(stage))
+    if module:
+        target = ["-c", f"import {module}"]
+        label = f"import {module}"
+    else:
+        target = [str(Path(__file__).resolve()), "--help"]
+        label = "pipeline.py --help"
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *target],
+        capture_output=True, text=True, cwd=Path(__file__).resolve().parent
+    )
+    wall = time.perf_counter() - start
+
+    rows = parse_importtime(proc.stderr)
+    total_us = sum(cum for _, _, cum, depth in rows if depth == 0)
+
+    print(f"📊 Import-time report for `{label}`")
+    print(f"   wall time:    {wall * 1000:.0f} ms")
+    print(f"   import time:  {total_us / 1000:.0f} ms across {len(rows)} modules")
+    print(f"   top {top} top-level imports by cumulative time:")
+    for name, _, cum, _ in sorted((r for r in rows if r[3] == 0), key=lambda r: -r[2])[:top]:
+        print(f"   {cum / 1000:8.1f} ms  {name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MTG predictor pipeline.")
+    parser.add_argument("--timing", action="store_true", help="print startup time before running")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stage_parsers = {name: sub.add_parser(name, help=help_text) for name, (_, _, help_text) in STAGES.items()}
+    for name in ["keyword-abilities", "keyword-actions", "glossary", "comprules-diff"]:
+        stage_parsers[name].add_argument("--pdf", type=Path, help="CompRules PDF (default: data/raw/MagicCompRules 20250404.pdf)")
+    stage_parsers["comprules-diff"].add_argument("--regenerate", action="store_true",
+                                                 help="then regenerate only the changed mechanics")
+    stage_parsers["mechanics"].add_argument("--only-changed", action="store_true",
+                                            help="regenerate only mechanics in comprules_changed_mechanics.json")
+    sub.add_parser("all", help="Run the full mechanic extraction pipeline")
+
+    predict = sub.add_parser("predict", help="Rank mechanics for new oracle text (see predict_mechanics.py --help)",
+                             add_help=False)
+    predict.add_argument("args", nargs=argparse.REMAINDER)
+
+    report = sub.add_parser("import-report", help="Measure import time of the CLI or a stage module")
+    report.add_argument("stage", nargs="?", choices=[*STAGES, "all", "predict"], help="report `import <module>` for the stage's module")
+    report.add_argument("--module", help="report `import <module>` instead (e.g. extract_flavor_word_card_data)")
+    report.add_argument("--top", type=int, default=15)
+
+    args = parser.parse_args(argv)
+
+    if args.timing:
+        print(f"⏱️ startup: {(time.perf_counter() - _START) * 1000:.0f} ms")
+
+    if args.command == "all":
+        for name in FULL_PIPELINE:
+            print(f"▶️ {name}")
+            run_stage(name)
+        print("✅ Pipeline complete! Output written to: data/static/ml_ready_mechanics.json")
+    elif args.command == "predict":
+        run_predict(args.args)
+    elif args.command == "import-report":
+        import_report(args.stage, args.module, args.top)
+    elif args.command == "comprules-diff":
+        run_comprules_diff(args.pdf, args.regenerate)
+    elif args.command == "mechanics":
+        run_mechanics(args.only_changed)
+    elif getattr(args, "pdf", None):
+        run_stage(args.command, pdf_path=args.pdf)
+    else:
+        run_stage(args.command)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import ast
+from pathlib import Path
+
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+EMBED_PATH = ROOT / "data" / "processed" / "text_embeddings.npy"
+CARDS_PATH = ROOT / "data" / "processed" / "enriched_cards.csv"
+VIS_DIR = ROOT / "visualizations"
+
+# output file stem → (column, plot title, legend title, palette). A palette of
+# None picks tab10 for ≤10 categories and husl otherwise, as in the notebook.
+UMAP_PLOTS = {
+    "umap_by_color": ("color_str", "UMAP Projection of Oracle Text Embeddings (by Color)", "Color Identity", ("hsv", 8)),
+    "umap_by_color_identity": ("color_str", "UMAP Projection by Color Identity", "Color Identity", None),
+    "umap_by_card_type": ("type_line", "UMAP Projection by Card Type (type_line)", "Card Type (type_line)", None),
+    "umap_by_rarity": ("rarity", "UMAP Projection by Rarity", "Rarity", None),
+    "umap_by_set": ("set", "UMAP Projection by Set", "Set", None),
+    "umap_by_cmc": ("cmc", "UMAP Projection by Converted Mana Cost (CMC)", "Converted Mana Cost (CMC)", None),
+    "umap_by_mechanic_count": ("mechanic_count", "UMAP Projection by Mechanic Count", "Mechanic Count", None),
+}
+
+
+def color_to_str(color_list):
+    if isinstance(color_list, str):
+        try:
+            parsed = ast.literal_eval(color_list)
+            return "".join(sorted(parsed)) if parsed else "C"  # C = Colorless
+        except (ValueError, SyntaxError):
+            return "C"
+    return "C"
+
+
+def reduce_umap(embeddings, random_state=42):
+    import umap
+
+    reducer = umap.UMAP(n_neighbors=15, min_dist=0.1, metric="cosine", random_state=random_state)
+    return reducer.fit_transform(embeddings)
+
+
+def plot_umap(embed_path=EMBED_PATH, cards_path=CARDS_PATH, vis_dir=VIS_DIR):
+    """Script version of 3_umap_visualization.ipynb (saves figures, no display)."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import pandas as pd
+    import seaborn as sns
+    from predict_mechanics import parse_mechanics
+
+    sns.set(style="whitegrid")
+
+    # === Load embeddings and metadata ===
+    if not embed_path.exists():
+        raise FileNotFoundError(f"❌ Could not find text embeddings at {embed_path}")
+    if not cards_path.exists():
+        raise FileNotFoundError(f"❌ Could not find enriched card data at {cards_path}")
+
+    embeddings = np.load(embed_path)
+    df = pd.read_csv(cards_path)
+    print(f"✅ Loaded {embeddings.shape[0]} embeddings and {len(df)} cards")
+
+    # === Run UMAP ===
+    embedding_2d = reduce_umap(embeddings)
+    df["umap_x"] = embedding_2d[:, 0]
+    df["umap_y"] = embedding_2d[:, 1]
+    print("✅ UMAP reduction complete")
+
+    df["color_str"] = df["colors"].apply(color_to_str)
+    df["mechanic_count"] = df["parsed_mechanics"].apply(lambda x: len(parse_mechanics(x)))
+
+    vis_dir.mkdir(parents=True, exist_ok=True)
+    for stem, (column, title, legend, palette) in UMAP_PLOTS.items():
+        plt.figure(figsize=(10, 8))
+        if palette is None:
+            palette = "tab10" if df[column].nunique() <= 10 else "husl"
+        else:
+            palette = sns.color_palette(*palette)
+        sns.scatterplot(data=df, x="umap_x", y="umap_y", hue=column, s=10, linewidth=0, palette=palette)
+        plt.title(title)
+        plt.legend(title=legend, bbox_to_anchor=(1.05, 1), loc="upper left")
+        plt.tight_layout()
+        plt.savefig(vis_dir / f"{stem}.png", dpi=300)
+        plt.close()
+        print(f"📁 Saved {stem}.png")
+
+
+if __name__ == "__main__":
+    plot_umap()
@@ -0,0 +1,278 @@
+import argparse
+import ast
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from artifact_writer import write_artifact
+
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+DATA_PROCESSED = ROOT / "data" / "processed"
+
+EMBEDDINGS_PATH = DATA_PROCESSED / "text_embeddings.npy"
+# Labels come from parsed_cards.csv (same row order as enriched_cards.csv):
+# notebook 1 re-parses `parsed_mechanics` with json.loads, which turns
+# notebook 0's Python list reprs into [] in enriched_cards.csv.
+CARDS_PATH = DATA_PROCESSED / "parsed_cards.csv"
+
+MODEL_NAME = "all-MiniLM-L6-v2"  # must match 2_text_embeddings.ipynb
+
+
+# === Helpers ===
+def parse_mechanics(val):
+    """Parse a `parsed_mechanics` cell (JSON or Python list repr) into a list."""
+    if isinstance(val, list):
+        return val
+    if not isinstance(val, str) or not val.strip():
+        return []
+    try:
+        return json.loads(val)
+    except ValueError:
+        pass
+    try:
+        parsed = ast.literal_eval(val)
+        return list(parsed) if isinstance(parsed, (list, tuple)) else []
+    except (ValueError, SyntaxError):
+        return []
+
+
+def normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def read_jsonl(path):
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def precision_at_k(ranked, gold, k):
+    """Mean precision@k over queries that have at least one gold mechanic."""
+    hits = []
+    for predicted, expected in zip(ranked, gold):
+        if not expected:
+            continue
+        expected = set(expected)
+        hits.append(sum(1 for m in predicted[:k] if m in expected) / k)
+    return float(np.mean(hits)) if hits else 0.0
+
+
+# === Engine ===
+class MechanicPredictor:
+    """
+    Ranks mechanics for oracle text against the stored card embeddings.
+
+    The embeddings (cards × dim) and the card × mechanic label matrix are
+    loaded once; every batch of queries is then scored with matrix products:
+    - knn:      similarity-weighted vote of the k nearest stored cards
+    - centroid: cosine similarity to each mechanic's mean embedding
+    """
+
+    def __init__(self, embeddings, card_mechanics, method="knn", neighbors=25):
+        if len(embeddings) != len(card_mechanics):
+            raise ValueError(
+                f"❌ {len(embeddings)} embeddings but {len(card_mechanics)} labelled cards"
+            )
+
+        if not any(card_mechanics):
+            raise ValueError(
+                "❌ No labelled mechanics loaded: every card's `parsed_mechanics` is empty"
+            )
+
+        self.method = method
+        self.neighbors = neighbors
+        self.embeddings = normalize_rows(np.asarray(embeddings, dtype=np.float32))
+
+        # Card × mechanic 0/1 matrix
+        self.mechanics = sorted({m for ms in card_mechanics for m in ms})
+        index = {m: i for i, m in enumerate(self.mechanics)}
+        self.labels = np.zeros((len(card_mechanics), len(self.mechanics)), dtype=np.float32)
+        for row, ms in enumerate(card_mechanics):
+            for m in ms:
+                self.labels[row, index[m]] = 1.0
+
+        if method == "centroid":
+            counts = self.labels.sum(axis=0)
+            counts[counts == 0] = 1.0
+            centroids = (self.labels.T @ self.embeddings) / counts[:, None]
+            self.centroids = normalize_rows(centroids)
+
+        self._model = None
+
+    @classmethod
+    def from_files(cls, embeddings_path=EMBEDDINGS_PATH, cards_path=CARDS_PATH, **kwargs):
+        if not embeddings_path.exists():
+            raise FileNotFoundError(f"❌ Could not find text embeddings at {embeddings_path}")
+        if not cards_path.exists():
+            raise FileNotFoundError(f"❌ Could not find parsed card data at {cards_path}")
+
+        import pandas as pd
+
+        embeddings = np.load(embeddings_path)
+        df = pd.read_csv(cards_path)
+        card_mechanics = df["parsed_mechanics"].apply(parse_mechanics).tolist()
+        return cls(embeddings, card_mechanics, **kwargs)
+
+    def load_model(self):
+        """Load the sentence-transformer once; `embed` calls this lazily."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(MODEL_NAME)
+        return self._model
+
+    def embed(self, texts, batch_size=256):
+        vectors = self.load_model().encode(texts, batch_size=batch_size, show_progress_bar=False)
+        return normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+    def card_mechanics(self, rows):
+        """Mechanic names labelled on the given stored rows."""
+        return [[self.mechanics[j] for j in np.flatnonzero(self.labels[i])] for i in rows]
+
+    def without_rows(self, rows):
+        """A predictor built from every stored row except `rows` (for held-out evaluation)."""
+        keep = np.setdiff1d(np.arange(len(self.embeddings)), rows)
+        return MechanicPredictor(
+            self.embeddings[keep], self.card_mechanics(keep),
+            method=self.method, neighbors=self.neighbors
+        )
+
+    def score(self, queries):
+        """Score a (n × dim) block of normalized query vectors against every mechanic."""
+        if self.method == "centroid":
+            return queries @ self.centroids.T
+
+        sims = queries @ self.embeddings.T
+
+        k = min(self.neighbors, sims.shape[1])
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        weights = np.clip(np.take_along_axis(sims, top, axis=1), 0.0, None)
+        # (n × k) weights against (n × k × mechanics) neighbour labels
+        scores = np.einsum("nk,nkm->nm", weights, self.labels[top])
+        totals = weights.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1.0
+        return scores / totals
+
+    def rank(self, scores, top_k=5):
+        k = min(top_k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        return [
+            [(self.mechanics[i], float(s)) for i, s in zip(row_idx, row_scores)]
+            for row_idx, row_scores in zip(top, top_scores)
+        ]
+
+    def predict(self, texts, top_k=5, batch_size=256):
+        results = []
+        for start in range(0, len(texts), batch_size):
+            queries = self.embed(texts[start:start + batch_size], batch_size=batch_size)
+            results.extend(self.rank(self.score(queries), top_k))
+        return results
+
+
+# === Modes ===
+def run_predict(predictor, input_path, output_path, top_k, batch_size):
+    records = read_jsonl(input_path)
+    texts = [r.get("oracle_text", r.get("text", "")) for r in records]
+    print(f"✅ Loaded {len(texts)} texts from {input_path}")
+
+    # Load the model outside the timed region so the rate reflects scoring only
+    start = time.perf_counter()
+    predictor.load_model()
+    print(f"✅ Loaded {MODEL_NAME} in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    ranked = predictor.predict(texts, top_k=top_k, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+
+    write_artifact(output_path, [
+        {
+            "name": record.get("name"),
+            "predicted_mechanics": [{"mechanic": m, "score": round(s, 4)} for m, s in predictions]
+        }
+        for record, predictions in zip(records, ranked)
+    ])
+
+    rate = len(texts) / elapsed if elapsed else float("inf")
+    print(f"⚡ Predicted {len(texts)} texts in {elapsed:.2f}s ({rate:.1f} texts/s)")
+    print(f"📁 Saved predictions to {output_path}")
+
+
+def run_evaluate(predictor, input_path, holdout, seed, ks, batch_size):
+    max_k = max(ks)
+    start = time.perf_counter()
+
+    if input_path:
+        # External held-out set: JSONL rows with `oracle_text` and gold `mechanics`
+        records = read_jsonl(input_path)
+        texts = [r.get("oracle_text", r.get("text", "")) for r in records]
+        gold = [r.get("mechanics", []) for r in records]
+        ranked = predictor.predict(texts, top_k=max_k, batch_size=batch_size)
+        source = input_path.name
+    else:
+        # Held-out rows of the stored set, scored against a predictor built
+        # only from the remaining rows (neighbours and centroids exclude them)
+        rng = np.random.default_rng(seed)
+        n = len(predictor.embeddings)
+        held = rng.choice(n, size=max(1, int(n * holdout)), replace=False)
+        gold = predictor.card_mechanics(held)
+        train = predictor.without_rows(held)
+        ranked = []
+        for s in range(0, len(held), batch_size):
+            queries = predictor.embeddings[held[s:s + batch_size]]
+            ranked.extend(train.rank(train.score(queries), max_k))
+        source = f"{len(held)} held-out stored cards"
+
+    elapsed = time.perf_counter() - start
+    ranked_names = [[m for m, _ in preds] for preds in ranked]
+
+    print(f"📊 Evaluation on {source} ({predictor.method})")
+    for k in ks:
+        print(f"   precision@{k}: {precision_at_k(ranked_names, gold, k):.4f}")
+    rate = len(ranked) / elapsed if elapsed else float("inf")
+    print(f"⚡ Scored {len(ranked)} queries in {elapsed:.2f}s ({rate:.1f} queries/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Predict likely mechanics for unseen oracle text.")
+    parser.add_argument("--input", type=Path, help="JSONL file with one {\"oracle_text\": ...} per line")
+    parser.add_argument("--output", type=Path, default=DATA_PROCESSED / "predicted_mechanics.jsonl")
+    parser.add_argument("--method", choices=["knn", "centroid"], default="knn")
+    parser.add_argument("--neighbors", type=int, default=25, help="k for knn scoring")
+    parser.add_argument("--top-k", type=int, default=5, help="mechanics returned per text")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--evaluate", action="store_true",
+                        help="report precision@k (on --input if given, else a held-out split)")
+    parser.add_argument("--holdout", type=float, default=0.1, help="fraction of stored cards held out")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 3, 5], help="k values for precision@k")
+    args = parser.parse_args(argv)
+    if not 0 < args.holdout < 1:
+        parser.error(f"--holdout must be between 0 and 1 (exclusive), got {args.holdout}")
+
+    start = time.perf_counter()
+    predictor = MechanicPredictor.from_files(method=args.method, neighbors=args.neighbors)
+    print(f"✅ Loaded {len(predictor.embeddings)} cards × {len(predictor.mechanics)} mechanics "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    if args.evaluate:
+        run_evaluate(predictor, args.input, args.holdout, args.seed, args.k, args.batch_size)
+    elif args.input:
+        run_predict(predictor, args.input, args.output, args.top_k, args.batch_size)
+    else:
+        parser.error("--input is required unless --evaluate is given")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
-import requests
-import json
+from pathlib import Path
+
+from artifact_writer import write_artifact
+
+# === Paths ===
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_PATH = ROOT / "data" / "static" / "scryfall_subset_patch.json"
 
 search_terms = {
     "aftermath": 'o:"aftermath"',
@@ -11,26 +16,39 @@ search_terms = {
     "nightbound": 'keyword:nightbound'
 }
 
-results = {}
 
-for label, query in search_terms.items():
-    url = f"https://api.scryfall.com/cards/search?q={query}"
-    print(f"🔍 Querying: {query}")
-    cards = []
+def fetch_subset_patch(terms=search_terms):
+    import requests
+
+    results = {}
+
+    for label, query in terms.items():
+        url = f"https://api.scryfall.com/cards/search?q={query}"
+        print(f"🔍 Querying: {query}")
+        cards = []
+
+        while url:
+            response = requests.get(url)
+            data = response.json()
+            if "data" not in data:
+                print(f"❌ Failed: {data.get('details')}")
+                break
+            cards.extend(data["data"])
+            url = data.get("next_page")
+
+        results[label.lower()] = cards
+        print(f"✅ Found {len(cards)} cards for '{label}'")
+
+    return results
+
 
-    while url:
-        response = requests.get(url)
-        data = response.json()
-        if "data" not in data:
-            print(f"❌ Failed: {data.get('details')}")
-            break
-        cards.extend(data["data"])
-        url = data.get("next_page")
+def scryfall_mechanic_subset_patch(output_path=OUTPUT_PATH):
+    results = fetch_subset_patch()
+    write_artifact(output_path, results)
 
-    results[label.lower()] = cards
-    print(f"✅ Found {len(cards)} cards for '{label}'")
+    print(f"✅ Saved patch data to {Path(output_path).name}")
+    return results
 
-with open("../data/static/scryfall_subset_patch.json", "w") as f:
-    json.dump(results, f, indent=2)
 
-print("✅ Saved patch data to scryfall_subset_patch.json")
+if __name__ == "__main__":
+    scryfall_mechanic_subset_patch()
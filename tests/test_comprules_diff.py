@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from comprules_diff import diff_entries, merge_entries, touched_names
+from generate_full_mechanics_list import build_mechanics, dedupe_mechanics, regenerate_mechanics
+
+
+def rule(code, name, text):
+    return {"code": code, "name": name, "subsections": [{"id": f"{code}a", "text": text}]}
+
+
+def inputs_for(keyword_abilities):
+    return {
+        "scryfall": [{"name": "Card A", "oracle_text": "Deathtouch\nDefender"},
+                     {"name": "Card B", "oracle_text": "Guardian"}],
+        "keyword_abilities": keyword_abilities,
+        "keyword_actions": [],
+        "glossary": [],
+        "ability_words": [],
+        "flavor_words": [],
+        "subset_patch": {},
+    }
+
+
+def test_renamed_rule_regenerates_like_full_rebuild():
+    previous = {
+        "702.2": rule("702.2", "Deathtouch", "Deathtouch is a static ability."),
+        "702.3": rule("702.3", "Defender", "Defender is a static ability."),
+    }
+    current = {
+        "702.2": rule("702.2", "Deathtouch", "Deathtouch is a static ability. Updated."),
+        "702.3": rule("702.3", "Guardian", "Guardian is a static ability."),
+    }
+
+    diff = diff_entries(previous, current)
+    assert diff == {"added": [], "changed": ["702.2", "702.3"], "removed": []}
+
+    names = touched_names(previous, current, diff, lambda e: e["name"])
+    assert set(names) == {"Deathtouch", "Defender", "Guardian"}
+
+    existing = dedupe_mechanics(build_mechanics(inputs_for(list(previous.values()))))
+    new_inputs = inputs_for(merge_entries(previous, current, diff))
+
+    incremental = regenerate_mechanics(names, existing, new_inputs)
+    full = dedupe_mechanics(build_mechanics(new_inputs))
+    assert incremental == full